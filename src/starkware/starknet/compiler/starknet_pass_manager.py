@@ -8,6 +8,12 @@ from starkware.starknet.compiler.storage_var import (
     StorageVarDeclVisitor, StorageVarImplentationVisitor)
 from starkware.starknet.security.hints_whitelist import get_hints_whitelist
 
+_ADDITIONAL_MODULES = (
+    'starkware.cairo.common.cairo_builtins',
+    'starkware.cairo.common.hash',
+    'starkware.starknet.core.storage.storage',
+)
+
 
 def starknet_pass_manager(
         prime: int, read_module: Callable[[str], Tuple[str, str]],
@@ -20,12 +26,7 @@ def starknet_pass_manager(
     # Use ModuleCollector.additional_modules to import necessary modules, whose import line
     # may be added after the module_collector phase.
     manager.replace('module_collector', ModuleCollector(
-        read_module=read_module,
-        additional_modules=[
-            'starkware.cairo.common.cairo_builtins',
-            'starkware.cairo.common.hash',
-            'starkware.starknet.core.storage.storage',
-        ]))
+        read_module=read_module, additional_modules=_ADDITIONAL_MODULES))
 
     manager.add_before(
         existing_stage='identifier_collector',
@@ -1,12 +1,18 @@
 import os
-from typing import Callable, Dict, Iterable, List, Optional, TypeVar, Union
+import re
+import string
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, TypeVar, Union
 
 import marshmallow
 import marshmallow.validate
-from web3 import Web3
 
 DNS_REGEX = r'^((?!-)[${}a-z0-9-]{1,63}(?<!-)\.)+([a-z]{2,6}[\.]{0,1})$'
 
+_DNS_LABEL_CHARS = frozenset(string.ascii_lowercase + string.digits + '-${}')
+_DNS_TOP_LEVEL_DOMAIN_CHARS = frozenset(string.ascii_lowercase)
+_HEX_DIGITS = frozenset(string.hexdigits)
+_CUSTOMER_ID_RE = re.compile(r'^[A-Za-z0-9_-]+$')
+
 T = TypeVar('T')
 TypeKey = TypeVar('TypeKey')
 TypeValue = TypeVar('TypeValue')
@@ -20,7 +26,8 @@ def validate_regex_match(
         field_name: str, *, regex: str, allow_none: bool, regex_description: str) -> ValidatorType:
     error_message = 'Invalid {field_name}: {{input}}; must be a legal {regex_description}'.format(
         field_name=field_name, regex_description=regex_description)
-    validate_regex = marshmallow.validate.Regexp(regex=regex, error=error_message)
+    validate_regex = _validate_pattern_match(
+        pattern=re.compile(regex), error_message=error_message)
 
     def validator(value):
         if value is None:
@@ -35,8 +42,18 @@ def validate_regex_match(
 
 
 def validate_dns(*, allow_none: bool) -> ValidatorType:
-    return validate_regex_match(
-        field_name='dns', regex=DNS_REGEX, allow_none=allow_none, regex_description='DNS label')
+    error_message = 'Invalid dns: {input}; must be a legal DNS label'
+
+    def validator(value):
+        if allow_none and value is None:
+            return True
+
+        if not _is_dns_name(value):
+            raise marshmallow.ValidationError(error_message.format(input=value))
+
+        return value
+
+    return validator
 
 
 def validate_url(
@@ -111,17 +128,15 @@ def validate_in_range(
 def validate_positive(field_name: str, *, allow_none: bool = False) -> ValidatorType:
     error_message = 'Invalid {field_name}: {{input}}; must be a positive value'.format(
         field_name=field_name)
-    return validate_in_range(
-        field_name=field_name, min_value=0, min_inclusive=False, allow_none=allow_none,
-        error_message=error_message)
+    return _validate_lower_bound(
+        error_message=error_message, allow_none=allow_none, inclusive=False)
 
 
-def validate_non_negative(field_name, *, allow_none=False):
+def validate_non_negative(field_name: str, *, allow_none: bool = False) -> ValidatorType:
     error_message = 'Invalid {field_name}: {{input}}; must be a non-negative value'.format(
         field_name=field_name)
-    return validate_in_range(
-        field_name=field_name, min_value=0, min_inclusive=True, allow_none=allow_none,
-        error_message=error_message)
+    return _validate_lower_bound(
+        error_message=error_message, allow_none=allow_none, inclusive=True)
 
 
 def validate_positive_or_infinity(field_name: str) -> ValidatorType:
@@ -147,17 +162,25 @@ def validate_public_key(field_name: str) -> ValidatorType:
     error_message = 'Invalid {field_name}: {{input}}; must be a legal Ethereum address'.format(
         field_name=field_name)
 
-    address_regex = r'^0x[a-fA-F0-9]{40}$'
-    validate_address_regex = marshmallow.validate.Regexp(regex=address_regex, error=error_message)
+    is_checksum_address: Optional[Callable[[str], bool]] = None
 
     def validator(addresses: Union[str, List[str]]):
+        nonlocal is_checksum_address
         if isinstance(addresses, str):
             addresses = [addresses]
 
         for address in addresses:
-            validate_address_regex(address)
+            if not _is_hex_string(address, n_digits=40):
+                raise marshmallow.ValidationError(error_message.format(input=address))
+
+            if is_checksum_address is None:
+                # Imported here, since importing web3 is slow, and it is only needed for the
+                # checksum validation.
+                from web3 import Web3
+
+                is_checksum_address = Web3.isChecksumAddress
 
-            if not Web3.isChecksumAddress(address):
+            if not is_checksum_address(address):
                 raise marshmallow.ValidationError(error_message.format(input=address))
 
         return True
@@ -169,25 +192,31 @@ def validate_private_key(field_name: str) -> ValidatorType:
     error_message = 'Invalid {field_name}: {{input}}; must be a legal Ethereum private key'.format(
         field_name=field_name)
 
-    private_key_regex = r'^0x[a-fA-F0-9]{64}$'
-    return marshmallow.validate.Regexp(regex=private_key_regex, error=error_message)
+    def validator(value: str):
+        if not _is_hex_string(value, n_digits=64):
+            raise marshmallow.ValidationError(error_message.format(input=value))
+
+        return value
+
+    return validator
 
 
 def validate_customer_id(field_name: str) -> ValidatorType:
     error_message = 'Invalid {field_name}: {{input}}; must be an alphanumeric string'.format(
         field_name=field_name)
-    return marshmallow.validate.Regexp(regex=r'^[A-Za-z0-9_-]+$', error=error_message)
+    return _validate_pattern_match(pattern=_CUSTOMER_ID_RE, error_message=error_message)
 
 
 def validate_absolute_linux_path(field_name: str, *, allow_none: bool) -> ValidatorType:
     error_message = 'Invalid {field_name}: {{input}}; must be a legal absolute Linux path'.format(
         field_name=field_name)
+    isabs = os.path.isabs
 
     def validator(value: str):
         if allow_none and value is None:
             return True
 
-        if not os.path.isabs(value):
+        if not isabs(value):
             raise marshmallow.ValidationError(error_message.format(input=value))
 
         return True
@@ -217,20 +246,19 @@ def validate_dict(
     These validators should be methods that get the field name, and return the validator for that
     field. Set these validators to None to have empty validators, which will always return True.
     """
+    validate_key = (lambda key: True) if key_validator is None else key_validator(field_name)
+    validate_value = (
+        (lambda value: True) if value_validator is None else value_validator(field_name))
+
     def validator(dictionary: Dict[TypeKey, TypeValue]):
-        nonlocal key_validator, value_validator
         if allow_none and dictionary is None:
             return True
-        if key_validator is None:
-            key_validator = (lambda name: lambda key: True)
-        if value_validator is None:
-            value_validator = (lambda name: lambda value: True)
         for key, value in dictionary.items():
             try:
-                (key_validator(str(key)))(key)
-                (value_validator(str(key)))(value)
+                validate_key(key)
+                validate_value(value)
             except Exception as e:
-                raise type(e)(f'Dictionary {field_name} is not valid: ' + str(e))
+                raise type(e)(f'Dictionary {field_name} is not valid at key {key!r}: ' + str(e))
         return True
 
     return validator
@@ -244,14 +272,75 @@ def validate_power_of_two(field_name: str) -> ValidatorType:
         field_name=field_name)
 
     def validator(value):
-        tmp_value = value
-        while tmp_value > 1:
-            if tmp_value % 2 == 1:
-                break
-            tmp_value = tmp_value // 2
+        if not (isinstance(value, int) and value > 0 and (value & (value - 1)) == 0):
+            raise marshmallow.ValidationError(error_message.format(input=value))
+        return True
+
+    return validator
+
 
-        if tmp_value != 1:
+# Validators for private use in this file.
+
+def _validate_lower_bound(
+        error_message: str, *, allow_none: bool, inclusive: bool) -> ValidatorType:
+    """
+    Returns a validator that checks that the value is non-negative (if inclusive) or positive.
+    Equivalent to validate_in_range with a lower bound of 0, without the overhead of
+    marshmallow.validate.Range.
+    """
+    def validator(value):
+        if value is None:
+            if allow_none:
+                return True
+
+            raise marshmallow.ValidationError(error_message.format(input=value))
+
+        if (value < 0) if inclusive else (value <= 0):
             raise marshmallow.ValidationError(error_message.format(input=value))
+
         return True
 
     return validator
+
+
+def _validate_pattern_match(*, pattern: Pattern[str], error_message: str) -> ValidatorType:
+    """
+    Returns a validator that checks that the value matches the given precompiled pattern.
+    """
+    match = pattern.match
+
+    def validator(value: str):
+        if match(value) is None:
+            raise marshmallow.ValidationError(error_message.format(input=value))
+
+        return value
+
+    return validator
+
+
+def _is_dns_name(value: str) -> bool:
+    """
+    Checks that the value matches DNS_REGEX, by scanning its labels one by one rather than using
+    the regex, whose nested quantifiers may backtrack heavily.
+    """
+    if not isinstance(value, str):
+        return False
+
+    labels = (value[:-1] if value.endswith('.') else value).split('.')
+    top_level_domain = labels[-1]
+    if len(labels) < 2 or not 2 <= len(top_level_domain) <= 6 or \
+            not _DNS_TOP_LEVEL_DOMAIN_CHARS.issuperset(top_level_domain):
+        return False
+
+    return all(
+        1 <= len(label) <= 63 and label[0] != '-' and label[-1] != '-' and
+        _DNS_LABEL_CHARS.issuperset(label) for label in labels[:-1])
+
+
+def _is_hex_string(value: str, *, n_digits: int) -> bool:
+    """
+    Checks that the value is a '0x'-prefixed string of exactly n_digits hexadecimal digits.
+    """
+    return (
+        isinstance(value, str) and len(value) == n_digits + 2 and value.startswith('0x') and
+        _HEX_DIGITS.issuperset(value[2:]))
@@ -0,0 +1,149 @@
+import random
+import re
+import sys
+
+import marshmallow
+import pytest
+
+from starkware.python.random_test import parametrize_random_object
+from starkware.starkware_utils.field_validators import (
+    DNS_REGEX, validate_dict, validate_dns, validate_positive, validate_private_key,
+    validate_public_key)
+
+
+@pytest.mark.parametrize('value, is_valid', [
+    ('a.com', True),
+    ('sub-domain.a1.co.', True),
+    ('${env}.starkware.io', True),
+    # Label length.
+    ('a' * 63 + '.com', True),
+    ('a' * 64 + '.com', False),
+    # Leading and trailing '-' in a label.
+    ('-a.com', False),
+    ('a-.com', False),
+    ('a-b.com', True),
+    # Top level domain length.
+    ('a.co', True),
+    ('a.c', False),
+    ('a.abcdef', True),
+    ('a.abcdefg', False),
+    ('a.c0m', False),
+    # Trailing '.'.
+    ('a.com.', True),
+    ('a.com..', False),
+    # Empty labels.
+    ('a..com', False),
+    ('.com', False),
+    ('com', False),
+    ('', False),
+    # Uppercase.
+    ('A.com', False),
+    ('a.COM', False),
+    # Trailing newline, which DNS_REGEX accepts due to the '$' anchor.
+    ('a.com\n', False),
+    # Non-str input.
+    (None, False),
+    (b'a.com', False),
+    (17, False),
+])
+def test_validate_dns(value, is_valid: bool):
+    validator = validate_dns(allow_none=False)
+    if is_valid:
+        assert validator(value) == value
+    else:
+        with pytest.raises(marshmallow.ValidationError, match='must be a legal DNS label'):
+            validator(value)
+
+
+def test_validate_dns_none():
+    assert validate_dns(allow_none=True)(None)
+    with pytest.raises(marshmallow.ValidationError, match='must be a legal DNS label'):
+        validate_dns(allow_none=False)(None)
+
+
+@parametrize_random_object()
+def test_validate_dns_matches_regex(random_object: random.Random):
+    validator = validate_dns(allow_none=False)
+    dns_regex = re.compile(DNS_REGEX)
+    alphabet = 'az09-.${}A_'
+    for _ in range(10000):
+        value = ''.join(
+            random_object.choice(alphabet) for _ in range(random_object.randrange(12)))
+        if dns_regex.match(value) is not None:
+            assert validator(value) == value
+        else:
+            with pytest.raises(marshmallow.ValidationError):
+                validator(value)
+
+
+PRIVATE_KEY = '0x' + '0123456789abcdefABCDEF0123456789abcdefABCDEF0123456789abcdefABCD'
+
+
+def test_validate_private_key():
+    assert validate_private_key('key')(PRIVATE_KEY) == PRIVATE_KEY
+
+
+@pytest.mark.parametrize('value', [
+    # Wrong prefix.
+    '0X' + PRIVATE_KEY[2:],
+    '00' + PRIVATE_KEY[2:],
+    PRIVATE_KEY[2:] + '00',
+    # Wrong length.
+    PRIVATE_KEY[:-1],
+    PRIVATE_KEY + '0',
+    # Non-hex characters.
+    PRIVATE_KEY[:-1] + 'g',
+    PRIVATE_KEY[:-1] + ' ',
+    PRIVATE_KEY[:-1] + '\n',
+    # Non-str input.
+    None,
+    PRIVATE_KEY.encode('ascii'),
+])
+def test_validate_private_key_invalid(value):
+    with pytest.raises(marshmallow.ValidationError, match='must be a legal Ethereum private key'):
+        validate_private_key('key')(value)
+
+
+# An EIP-55 checksum address.
+ADDRESS = '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed'
+
+
+def test_validate_public_key(monkeypatch):
+    validator = validate_public_key('address')
+    assert validator(ADDRESS)
+    assert validator([ADDRESS, ADDRESS])
+
+    # The second call uses the cached checksum function, so web3 is not imported again.
+    monkeypatch.setitem(sys.modules, 'web3', None)
+    assert validator(ADDRESS)
+
+    with pytest.raises(marshmallow.ValidationError, match='must be a legal Ethereum address'):
+        validator(ADDRESS.lower())
+
+
+@pytest.mark.parametrize('value', [
+    # Wrong prefix.
+    '0X' + ADDRESS[2:],
+    ADDRESS[2:] + '00',
+    # Wrong length.
+    ADDRESS[:-1],
+    ADDRESS + '0',
+    # Non-hex characters.
+    ADDRESS[:-1] + 'g',
+    # Non-str address.
+    [ADDRESS.encode('ascii')],
+])
+def test_validate_public_key_invalid_format(monkeypatch, value):
+    # Addresses with an invalid format are rejected without importing web3.
+    monkeypatch.setitem(sys.modules, 'web3', None)
+    with pytest.raises(marshmallow.ValidationError, match='must be a legal Ethereum address'):
+        validate_public_key('address')(value)
+
+
+def test_validate_dict():
+    validator = validate_dict('dd', value_validator=validate_positive)
+    assert validator({'a.com': 1})
+    with pytest.raises(
+            marshmallow.ValidationError,
+            match=re.escape("Dictionary dd is not valid at key 'b.com': Invalid dd: 0;")):
+        validator({'a.com': 1, 'b.com': 0})
@@ -1,8 +1,11 @@
 import dataclasses
+import functools
 import inspect
+import os
 import random
 import re
-from typing import Any, ClassVar, Dict, Optional, Sequence, Tuple, Type, TypeVar
+from typing import (
+    Any, Callable, ClassVar, Dict, Iterable, List, Mapping, Optional, Set, Tuple, Type, TypeVar)
 
 import marshmallow
 import marshmallow.fields as mfields
@@ -16,13 +19,24 @@ TValidatedDataclass = TypeVar('TValidatedDataclass', bound='ValidatedDataclass')
 TSerializableDataclass = TypeVar('TSerializableDataclass', bound='SerializableMarshmallowDataclass')
 T = TypeVar('T')
 
+# Runtime type validation of dataclass fields may be disabled by setting
+# STARKWARE_VALIDATE_TYPES=0 (e.g., where marshmallow already enforces the types on
+# deserialization). Value validations are performed regardless.
+VALIDATE_TYPES = os.environ.get('STARKWARE_VALIDATE_TYPES', '1') != '0'
 
+_CAMEL_CASE_BOUNDARY_RE = re.compile(r'([A-Z])')
+
+# Maps class name prefixes to their encoding, so that classes with the same name share it.
+_CLASS_NAME_PREFIXES: Dict[str, bytes] = {}
+
+
+@functools.lru_cache(maxsize=None)
 def camel_to_snake_case(camel_case_name: str) -> str:
     """
     Converts a name with Capital first letters to lower case with '_' as separators.
     For example, CamelToSnakeCase -> camel_to_snake_case.
     """
-    return (camel_case_name[0] + re.sub(r'([A-Z])', r'_\1', camel_case_name[1:])).lower()
+    return (camel_case_name[0] + _CAMEL_CASE_BOUNDARY_RE.sub(r'_\1', camel_case_name[1:])).lower()
 
 
 class SerializableMarshmallowDataclass(StringSerializable):
@@ -33,26 +47,48 @@ class SerializableMarshmallowDataclass(StringSerializable):
 
     class_name_prefix: ClassVar[bytes]
     Schema: ClassVar[Type[marshmallow.Schema]]
+    _schema: ClassVar[marshmallow.Schema]
 
     @classmethod
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)  # type: ignore[call-arg]
 
-        cls.class_name_prefix = camel_to_snake_case(camel_case_name=cls.__name__).encode('ascii')
+        name_prefix = camel_to_snake_case(camel_case_name=cls.__name__)
+        class_name_prefix = _CLASS_NAME_PREFIXES.get(name_prefix)
+        if class_name_prefix is None:
+            class_name_prefix = name_prefix.encode('ascii')
+            _CLASS_NAME_PREFIXES[name_prefix] = class_name_prefix
+
+        cls.class_name_prefix = class_name_prefix
+
+    @classmethod
+    def get_schema(cls) -> marshmallow.Schema:
+        """
+        Returns a Schema instance of the class, which is created once and reused by all
+        (de)serialization calls. The instance is rebuilt if cls.Schema is reassigned after it was
+        created (e.g., to a OneOfSchema of the class' subclasses).
+        """
+        # Look only at the class' own attributes, so that subclasses do not use their base's schema.
+        schema = cls.__dict__.get('_schema')
+        if type(schema) is not cls.Schema:
+            schema = cls.Schema()
+            cls._schema = schema
+
+        return schema
 
     def dump(self) -> dict:
-        return self.Schema().dump(obj=self)
+        return self.get_schema().dump(obj=self)
 
     @classmethod
     def load(cls: Type[TSerializableDataclass], data: dict) -> TSerializableDataclass:
-        return cls.Schema().load(data=data)
+        return cls.get_schema().load(data=data)
 
     def dumps(self) -> str:
-        return self.Schema().dumps(obj=self)
+        return self.get_schema().dumps(obj=self)
 
     @classmethod
     def loads(cls: Type[TSerializableDataclass], data: str) -> TSerializableDataclass:
-        return cls.Schema().loads(json_data=data)
+        return cls.get_schema().loads(json_data=data)
 
     @classmethod
     def prefix(cls) -> bytes:
@@ -130,27 +166,25 @@ class ValidatedDataclass:
         return cls(**new_object_data)  # type: ignore
 
     def validate_values(self):
-        for field in dataclasses.fields(self):
-            metadata = getattr(field, 'metadata', None)
-            if metadata is None:
-                continue
+        fields_with_validators = get_fields_with_validators(type(self))
+        if len(fields_with_validators) == 0:
+            return
 
-            value = getattr(self, field.name)
-            # First use the field_validated argument, and only if it does not exist,
-            # use the validation inside the marshmallow field argument.
-            validated_field = metadata.get('validated_field', None)
-            if validated_field is None:
-                marshmallow_field = field.metadata.get('marshmallow_field', None)
-                if marshmallow_field is not None:
-                    validate_field(field=marshmallow_field, value=value)
-            else:
-                name_in_messages = metadata.get('name_in_messages', None)
-                validated_field.validate(value=value, name=name_in_messages)
+        for name, validator in fields_with_validators:
+            validator(getattr(self, name))
 
     def validate_types(self):
-        for field in dataclasses.fields(self):
-            typeguard.check_type(
-                argname=field.name, value=getattr(self, field.name), expected_type=field.type)
+        if not VALIDATE_TYPES:
+            return
+
+        for name, expected_type, is_plain_class in get_type_checked_fields(type(self)):
+            value = getattr(self, name)
+            # An isinstance check is enough to accept values of plain classes; typeguard is used
+            # for all other types, and to produce the error message.
+            if is_plain_class and isinstance(value, expected_type):
+                continue
+
+            typeguard.check_type(argname=name, value=value, expected_type=expected_type)
 
 
 class ValidatedMarshmallowDataclass(ValidatedDataclass, SerializableMarshmallowDataclass):
@@ -169,6 +203,55 @@ def get_validated_field(field: dataclasses.Field) -> Optional[Field]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
+def get_fields_with_validators(cls: type) -> Tuple[Tuple[str, Callable[[Any], Any]], ...]:
+    """
+    Returns the (name, validator) tuple of each field of the given dataclass that has a
+    validation, in declaration order.
+    A field's validated_field is used for its validation, and only if it does not exist,
+    the validation inside its marshmallow_field is used.
+    The result is cached per class, as it is used in every instance creation.
+    """
+    fields_with_validators: List[Tuple[str, Callable[[Any], Any]]] = []
+    for field in dataclasses.fields(cls):
+        metadata = {} if field.metadata is None else field.metadata
+        validated_field = get_validated_field(field=field)
+        marshmallow_field = metadata.get('marshmallow_field', None)
+        if validated_field is not None:
+            fields_with_validators.append((field.name, functools.partial(
+                validated_field.validate, name=metadata.get('name_in_messages', None))))
+        elif marshmallow_field is not None:
+            fields_with_validators.append(
+                (field.name, functools.partial(validate_field, marshmallow_field)))
+
+    return tuple(fields_with_validators)
+
+
+@functools.lru_cache(maxsize=None)
+def get_type_checked_fields(cls: type) -> Tuple[Tuple[str, Any, bool], ...]:
+    """
+    Returns the (name, type, is_plain_class) tuple of each field of the given dataclass, where
+    is_plain_class is computed by _is_plain_class.
+    """
+    return tuple(
+        (field.name, field.type, _is_plain_class(field.type)) for field in dataclasses.fields(cls))
+
+
+def _is_plain_class(expected_type: Any) -> bool:
+    """
+    Returns whether any instance of the given type is a valid value for it, according to typeguard.
+    For such types, a passing isinstance check is enough to skip typeguard.check_type; a failing
+    one still falls back to typeguard (which, e.g., accepts ints for float).
+    Generic aliases, tuple subclasses (named tuples), dict subclasses (typed dicts) and protocols
+    are excluded, since typeguard checks their content or structure beyond isinstance.
+    """
+    return (
+        inspect.isclass(expected_type) and
+        getattr(expected_type, '__origin__', None) is None and
+        not issubclass(expected_type, (tuple, dict)) and
+        not getattr(expected_type, '_is_protocol', False))
+
+
 def late_marshmallow_dataclass(cls: Optional[type] = None, **kwargs):
     """
     A helper function for creating marshmallow dataclasses while inheriting fields from base class.
@@ -220,14 +303,21 @@ def process_class_annotations_and_attribute_values(cls) -> Tuple[Dict[str, Any],
     annotations: Dict[str, Any] = {}
     attr_values: Dict[str, Any] = {}
 
-    for base_cls in inspect.getmro(cls):
-        if '__annotations__' not in base_cls.__dict__:
-            continue
+    annotated_classes = [
+        base_cls for base_cls in inspect.getmro(cls) if '__annotations__' in base_cls.__dict__]
+
+    # Update annotations in reverse MRO order, so that they appear in that order, while the
+    # annotations of derived classes override those of their bases.
+    for base_cls in reversed(annotated_classes):
+        annotations.update(base_cls.__dict__['__annotations__'])
 
-        for name in base_cls.__annotations__:
-            if name in annotations:
+    seen_names: Set[str] = set()
+    for base_cls in annotated_classes:
+        for name in base_cls.__dict__['__annotations__']:
+            if name in seen_names:
                 # Attribute already seen in a derived class.
                 continue
+            seen_names.add(name)
 
             if name in base_cls.__dict__:
                 attr_values[name] = base_cls.__dict__[name]
@@ -240,9 +330,6 @@ def process_class_annotations_and_attribute_values(cls) -> Tuple[Dict[str, Any],
                 attr_values[name] = base_cls.__dict__['__dataclass_fields__'][name]
                 continue
 
-        # Prepand annotations, so that they appear in reverse MRO order.
-        annotations = {**base_cls.__annotations__, **annotations}
-
     return annotations, attr_values
 
 
@@ -307,16 +394,19 @@ def validate_field(field: mfields.Field, value: Any):
     validate_value(field=field, value=value)
 
     # Validate inner elements, if field is a container.
-    if isinstance(field, mfields.List):
-        validate_list(field, value)
-    elif isinstance(field, mfields.Mapping):
-        if field.key_field is not None:
-            validate_list(mfields.List(field.key_field), value.keys())
-        if field.value_field is not None:
-            validate_list(mfields.List(field.value_field), value.values())
+    container_validator = get_container_validator(type(field))
+    if container_validator is not None:
+        container_validator(field, value)
+
+
+def validate_mapping(mapping_field: mfields.Mapping, mapping_value: Mapping):
+    if mapping_field.key_field is not None:
+        validate_list(mfields.List(mapping_field.key_field), mapping_value.keys())
+    if mapping_field.value_field is not None:
+        validate_list(mfields.List(mapping_field.value_field), mapping_value.values())
 
 
-def validate_list(list_field: mfields.List, list_value: Sequence):
+def validate_list(list_field: mfields.List, list_value: Iterable):
     if not isinstance(list_field.inner, mfields.Field):
         # Nothing to check further, since it is not a marshmallow field.
         return
@@ -327,5 +417,47 @@ def validate_list(list_field: mfields.List, list_value: Sequence):
 
         raise marshmallow.ValidationError('Field may not be None.')
 
+    element_validator = get_element_validator(field=list_field.inner)
+    if element_validator is None:
+        return
+
     for inner_element in list_value:
-        validate_field(field=list_field.inner, value=inner_element)
+        element_validator(inner_element)
+
+
+def get_element_validator(field: mfields.Field) -> Optional[Callable[[Any], Any]]:
+    """
+    Returns a function that validates a single value of the given field, or None if there is
+    nothing to validate. The kind of the field is resolved once, so that validating the elements
+    of a container does not repeat it per element.
+    """
+    if get_container_validator(type(field)) is not None:
+        return functools.partial(validate_field, field)
+
+    if field.validate is not None and callable(field.validate):
+        return field.validate
+
+    return None
+
+
+# Validators of the inner elements of container fields, by field class.
+_CONTAINER_VALIDATORS: Dict[type, Callable[[Any, Any], None]] = {
+    mfields.List: validate_list,
+    mfields.Mapping: validate_mapping,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def get_container_validator(field_cls: type) -> Optional[Callable[[Any, Any], None]]:
+    """
+    Returns the validator of the inner elements of fields of the given class, or None if it is
+    not a container field class. Subclasses of container field classes (e.g., mfields.Dict) are
+    resolved through their MRO.
+    The result is cached per class, so that validate_field does a single lookup per call.
+    """
+    for base_cls in inspect.getmro(field_cls):
+        container_validator = _CONTAINER_VALIDATORS.get(base_cls)
+        if container_validator is not None:
+            return container_validator
+
+    return None